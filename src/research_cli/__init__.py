@@ -6,17 +6,19 @@ import os
 import sys
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.tree import Tree
-from rich import print as rprint
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
 
 __version__ = "0.1.1"
 
-console = Console()
 app = typer.Typer(
     name="research",
     help="CLI tool for structured research workflows with AI integration",
@@ -24,102 +26,216 @@ app = typer.Typer(
     invoke_without_command=True,
 )
 
+
+class AgentSpec(NamedTuple):
+    """Static configuration for a supported AI agent"""
+
+    name: str
+    commands_dir: str
+    cli_check: Optional[str]
+    requires_cli: bool
+    install_url: Optional[str]
+
+
 # AI Agent configurations
 AGENT_CONFIG = {
-    "claude": {
-        "name": "Claude Code",
-        "commands_dir": ".claude/commands",
-        "cli_check": "claude",
-        "requires_cli": False,
-        "install_url": None,
-    },
-    "copilot": {
-        "name": "GitHub Copilot",
-        "commands_dir": ".github/prompts",
-        "cli_check": None,
-        "requires_cli": False,
-        "install_url": None,
-    },
-    "gemini": {
-        "name": "Gemini CLI",
-        "commands_dir": ".gemini/commands",
-        "cli_check": "gemini",
-        "requires_cli": True,
-        "install_url": "https://github.com/google-gemini/gemini-cli",
-    },
-    "cursor": {
-        "name": "Cursor",
-        "commands_dir": ".cursor/commands",
-        "cli_check": None,
-        "requires_cli": False,
-        "install_url": None,
-    },
-    "opencode": {
-        "name": "OpenCode",
-        "commands_dir": ".opencode/command",
-        "cli_check": "opencode",
-        "requires_cli": True,
-        "install_url": "https://opencode.ai",
-    },
-    "codex": {
-        "name": "Codex CLI",
-        "commands_dir": ".codex",
-        "cli_check": "codex",
-        "requires_cli": True,
-        "install_url": "https://github.com/openai/codex",
-    }
+    "claude": AgentSpec(
+        name="Claude Code",
+        commands_dir=".claude/commands",
+        cli_check="claude",
+        requires_cli=False,
+        install_url=None,
+    ),
+    "copilot": AgentSpec(
+        name="GitHub Copilot",
+        commands_dir=".github/prompts",
+        cli_check=None,
+        requires_cli=False,
+        install_url=None,
+    ),
+    "gemini": AgentSpec(
+        name="Gemini CLI",
+        commands_dir=".gemini/commands",
+        cli_check="gemini",
+        requires_cli=True,
+        install_url="https://github.com/google-gemini/gemini-cli",
+    ),
+    "cursor": AgentSpec(
+        name="Cursor",
+        commands_dir=".cursor/commands",
+        cli_check=None,
+        requires_cli=False,
+        install_url=None,
+    ),
+    "opencode": AgentSpec(
+        name="OpenCode",
+        commands_dir=".opencode/command",
+        cli_check="opencode",
+        requires_cli=True,
+        install_url="https://opencode.ai",
+    ),
+    "codex": AgentSpec(
+        name="Codex CLI",
+        commands_dir=".codex",
+        cli_check="codex",
+        requires_cli=True,
+        install_url="https://github.com/openai/codex",
+    ),
 }
 
 
+# Valid --ai choices, derived from AGENT_CONFIG so typer rejects unknown
+# agents during argument parsing
+AIAgent = StrEnum("AIAgent", {agent: agent for agent in AGENT_CONFIG})
+
+
+BANNER = """
+    ╔═══════════════════════════════════════╗
+    ║                                       ║
+    ║         🔬 ResearchKit CLI            ║
+    ║                                       ║
+    ║   Structured Research Workflows       ║
+    ║        with AI Integration            ║
+    ║                                       ║
+    ╚═══════════════════════════════════════╝
+    """
+
+
+# Initial research constitution, pre-encoded since it is written verbatim
+DEFAULT_CONSTITUTION = """# Research Constitution
+
+## Research Methodology Principles
+
+### Citation Standards
+- All claims must be properly cited with sources
+- Prefer peer-reviewed sources when available
+- Cross-reference important claims with multiple sources
+- Maintain clear bibliography in sources.md
+
+### Source Quality Standards
+- Evaluate source credibility and bias
+- Note publication date and relevance
+- Distinguish between primary and secondary sources
+- Document limitations of sources
+
+### Research Process
+1. **Planning Phase**: Define clear research questions and scope
+2. **Execution Phase**: Systematic information gathering with proper documentation
+3. **Synthesis Phase**: Analysis and conclusion drawing with evidence
+
+### Verification Requirements
+- Cross-check facts across multiple sources
+- Question assumptions and biases
+- Document conflicting information
+- Mark uncertain claims clearly
+
+---
+*This constitution guides all research activities in this project.*
+""".encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """Get the shared Rich console
+
+    Rich is imported on first use so that paths which never print through
+    it (such as --version) don't pay its import cost.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
 class StepTracker:
-    """Track and display progress for multi-step operations"""
+    """Track and display progress for multi-step operations
+
+    When output is not a terminal (CI, pipes) steps are kept as plain lines
+    and written directly, skipping Rich's markup and tree rendering.
+    """
+
+    TITLE = "🔬 ResearchKit Setup"
 
     def __init__(self):
         self.steps = []
-        self.tree = Tree("🔬 ResearchKit Setup")
+        self.plain = not get_console().is_terminal
+        if not self.plain:
+            from rich.tree import Tree
+
+            self.tree = Tree(self.TITLE)
 
     def add_step(self, message: str, status: str = "✓"):
         """Add a completed step"""
-        self.tree.add(f"[green]{status}[/green] {message}")
+        if self.plain:
+            self.steps.append(f"{status} {message}")
+        else:
+            self.tree.add(f"[green]{status}[/green] {message}")
 
     def add_error(self, message: str):
         """Add an error step"""
-        self.tree.add(f"[red]✗[/red] {message}")
+        if self.plain:
+            self.steps.append(f"✗ {message}")
+        else:
+            self.tree.add(f"[red]✗[/red] {message}")
 
     def display(self):
         """Display the tree"""
-        console.print(self.tree)
+        if self.plain:
+            lines = [self.TITLE, *(f"  {step}" for step in self.steps)]
+            sys.stdout.write("\n".join(lines) + "\n")
+        else:
+            get_console().print(self.tree)
+
+
+@lru_cache(maxsize=1)
+def get_banner_text() -> "Text":
+    """Get the styled banner, built once and reused for every display"""
+    from rich.text import Text
+
+    return Text(BANNER, style="bold cyan")
 
 
 def show_banner():
     """Display ResearchKit banner"""
-    banner = """
-    ╔═══════════════════════════════════════╗
-    ║                                       ║
-    ║         🔬 ResearchKit CLI            ║
-    ║                                       ║
-    ║   Structured Research Workflows       ║
-    ║        with AI Integration            ║
-    ║                                       ║
-    ╚═══════════════════════════════════════╝
-    """
-    console.print(banner, style="bold cyan")
+    get_console().print(get_banner_text())
 
 
 def check_cli_tool(tool_name: str) -> bool:
     """Check if a CLI tool is available"""
+    executable = shutil.which(tool_name)
+    if executable is None:
+        return False
+
     try:
+        # An absolute executable path and close_fds=False let subprocess use
+        # posix_spawn instead of fork+exec (our fds are non-inheritable anyway)
         subprocess.run(
-            [tool_name, "--version"],
-            capture_output=True,
+            [executable, "--version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True,
-            timeout=2
+            timeout=2,
+            close_fds=False,
         )
         return True
     except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
         return False
 
 
+def get_git_version() -> Optional[str]:
+    """Get the installed git version string, or None if git is unavailable"""
+    try:
+        result = subprocess.run(
+            [shutil.which("git") or "git", "--version"],
+            capture_output=True,
+            text=True,
+            check=True,
+            close_fds=False,
+        )
+        return result.stdout.strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+
 def convert_md_to_toml(md_path: Path) -> tuple[str, str]:
     """Convert a markdown command file to TOML format for Gemini CLI
 
@@ -129,7 +245,7 @@ def convert_md_to_toml(md_path: Path) -> tuple[str, str]:
     Returns:
         Tuple of (toml_content, command_name)
     """
-    content = md_path.read_text()
+    content = md_path.read_text(encoding="utf-8")
 
     # Parse frontmatter
     description = ""
@@ -169,9 +285,57 @@ prompt = """
     return toml_content, command_name
 
 
-def get_common_researchkit_sections() -> str:
-    """Get common ResearchKit integration sections for README files"""
-    return """## ResearchKit Integration
+def scan_dir(directory: Union[str, Path]) -> Optional[dict[str, os.DirEntry]]:
+    """List a directory once as {name: entry}, or None if it doesn't exist
+
+    Membership tests against the result replace per-file exists() calls.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def iter_files(directory: Union[str, Path], suffix: str) -> Iterator[os.DirEntry]:
+    """Yield the regular files in a directory whose name ends with suffix
+
+    Uses os.scandir so the file type comes from the directory listing
+    instead of a separate stat per entry.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffix) and entry.is_file():
+                yield entry
+
+
+# Only Unix-like systems have an executable bit; elsewhere chmod is a no-op
+_CHMOD = os.chmod if os.name != "nt" else (lambda *args, **kwargs: None)
+
+
+def copy_file(src: Union[str, Path], dst: Path, executable: bool = False):
+    """Copy a single file's contents, optionally marking it executable"""
+    shutil.copyfile(src, dst)
+    if executable:
+        _CHMOD(dst, 0o755)
+
+
+def copy_files(jobs: list[tuple[Union[str, Path], Path, bool]]):
+    """Copy (src, dst, executable) jobs concurrently on a small thread pool
+
+    Each copy is a handful of blocking syscalls, so overlapping them hides
+    per-file open/close latency. Errors from any copy are re-raised.
+    """
+    if not jobs:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+        for _ in executor.map(lambda job: copy_file(*job), jobs):
+            pass
+
+
+# Common ResearchKit integration sections shared by agent README files
+COMMON_SECTIONS = """## ResearchKit Integration
 
 When working on research projects:
 1. Use the `.researchkit/` directory structure
@@ -197,54 +361,61 @@ bash .researchkit/scripts/bash/synthesize.sh
 """
 
 
-def get_template_dir() -> Path:
-    """Get the templates directory from the package"""
-    current_file = Path(__file__).resolve()
+def get_common_researchkit_sections() -> str:
+    """Get common ResearchKit integration sections for README files"""
+    return COMMON_SECTIONS
 
-    # Try system location first (Python's sys.prefix/share) - for installed packages
-    sys_templates = Path(sys.prefix) / "share" / "research-cli" / "templates"
-    if sys_templates.exists():
-        return sys_templates
 
-    # Try development location (repo root) - for editable installs
-    dev_templates = current_file.parent.parent.parent / "templates"
-    if dev_templates.exists():
-        return dev_templates
+# Resolved once at import; the package location does not change at runtime
+_PACKAGE_FILE = Path(__file__).resolve()
 
-    # Try alternative install locations
-    site_packages = current_file.parent.parent
-    installed_templates = site_packages / "share" / "research-cli" / "templates"
-    if installed_templates.exists():
-        return installed_templates
 
-    # Return dev location as fallback with a warning path
-    return dev_templates
+@lru_cache(maxsize=1)
+def get_template_dir() -> Path:
+    """Get the templates directory from the package"""
+    candidates = (
+        # System location (Python's sys.prefix/share) - for installed packages
+        Path(sys.prefix) / "share" / "research-cli" / "templates",
+        # Development location (repo root) - for editable installs
+        _PACKAGE_FILE.parent.parent.parent / "templates",
+        # Alternative install location
+        _PACKAGE_FILE.parent.parent / "share" / "research-cli" / "templates",
+    )
+
+    # Fall back to the dev location so callers can report the missing path
+    return next((path for path in candidates if path.exists()), candidates[1])
 
 
 def init_git_repo(project_dir: Path, tracker: StepTracker):
     """Initialize git repository if not already initialized"""
-    if (project_dir / ".git").exists():
+    # .git may be a file (worktrees, submodules), so test existence, not isdir;
+    # lexists skips resolving symlinks/reparse points we don't care about
+    project_path = os.fspath(project_dir)
+    if os.path.lexists(os.path.join(project_path, ".git")):
         tracker.add_step("Git repository already initialized")
         return
 
     # Ask user if they want to initialize git
-    console.print("\n[yellow]⚠[/yellow]  No git repository found in the current directory.")
+    get_console().print("\n[yellow]⚠[/yellow]  No git repository found in the current directory.")
     response = typer.confirm("Would you like to run 'git init' to initialize a git repository?")
 
     if not response:
-        console.print("\n[red]✗ ResearchKit needs Git to function[/red]\n")
+        get_console().print("\n[red]✗ ResearchKit needs Git to function[/red]\n")
         raise typer.Exit(1)
 
     try:
         subprocess.run(
             ["git", "init"],
-            cwd=project_dir,
+            cwd=project_path,
             check=True,
-            capture_output=True
+            # Only stderr is ever read, for the failure message
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
         tracker.add_step("Initialized git repository")
     except subprocess.CalledProcessError as e:
-        tracker.add_error(f"Failed to initialize git: {e}")
+        details = e.stderr.decode(errors="replace").strip() if e.stderr else ""
+        tracker.add_error(f"Failed to initialize git: {details or e}")
         raise typer.Exit(1)
     except FileNotFoundError:
         tracker.add_error("Git not found - please install git")
@@ -255,9 +426,12 @@ def create_researchkit_structure(project_dir: Path, tracker: StepTracker):
     """Create the .researchkit directory structure"""
     researchkit_dir = project_dir / ".researchkit"
 
-    # Create main directories
+    # Create main directories (parents listed before children, so every
+    # mkdir is a single syscall without re-walking shared ancestors)
     directories = [
+        researchkit_dir,
         researchkit_dir / "memory",
+        researchkit_dir / "scripts",
         researchkit_dir / "scripts" / "bash",
         researchkit_dir / "scripts" / "powershell",
         researchkit_dir / "research",
@@ -265,13 +439,17 @@ def create_researchkit_structure(project_dir: Path, tracker: StepTracker):
     ]
 
     for directory in directories:
-        directory.mkdir(parents=True, exist_ok=True)
+        directory.mkdir(exist_ok=True)
 
     tracker.add_step("Created .researchkit directory structure")
 
+    # Copy jobs are collected first and run together in copy_files()
+    copy_jobs = []
+
     # Copy template files
     template_dir = get_template_dir()
-    if not template_dir.exists():
+    template_entries = scan_dir(template_dir)
+    if template_entries is None:
         tracker.add_error(f"Template directory not found: {template_dir}")
         tracker.add_error("Templates must be included in package distribution")
     else:
@@ -285,10 +463,9 @@ def create_researchkit_structure(project_dir: Path, tracker: StepTracker):
 
         copied_count = 0
         for template_file in template_files:
-            src = template_dir / template_file
-            if src.exists():
+            if template_file in template_entries:
                 dst = researchkit_dir / "templates" / template_file
-                shutil.copy2(src, dst)
+                copy_jobs.append((template_entries[template_file].path, dst, False))
                 copied_count += 1
             else:
                 tracker.add_error(f"Template file not found: {template_file}")
@@ -300,29 +477,25 @@ def create_researchkit_structure(project_dir: Path, tracker: StepTracker):
 
     # Copy scripts
     scripts_dir = template_dir.parent / "scripts"
-    if not scripts_dir.exists():
+    script_entries = scan_dir(scripts_dir)
+    if script_entries is None:
         tracker.add_error(f"Scripts directory not found: {scripts_dir}")
     else:
         script_count = 0
-        # Copy bash scripts
-        bash_src = scripts_dir / "bash"
-        if bash_src.exists():
-            for script in bash_src.glob("*.sh"):
+        # Copy bash scripts (made executable on Unix-like systems)
+        if "bash" in script_entries:
+            for script in iter_files(script_entries["bash"].path, ".sh"):
                 dst = researchkit_dir / "scripts" / "bash" / script.name
-                shutil.copy2(script, dst)
-                # Make executable on Unix-like systems
-                if os.name != "nt":
-                    os.chmod(dst, 0o755)
+                copy_jobs.append((script.path, dst, True))
                 script_count += 1
         else:
             tracker.add_error("Bash scripts directory not found")
 
         # Copy PowerShell scripts
-        ps_src = scripts_dir / "powershell"
-        if ps_src.exists():
-            for script in ps_src.glob("*.ps1"):
+        if "powershell" in script_entries:
+            for script in iter_files(script_entries["powershell"].path, ".ps1"):
                 dst = researchkit_dir / "scripts" / "powershell" / script.name
-                shutil.copy2(script, dst)
+                copy_jobs.append((script.path, dst, False))
                 script_count += 1
 
         if script_count > 0:
@@ -330,85 +503,52 @@ def create_researchkit_structure(project_dir: Path, tracker: StepTracker):
         else:
             tracker.add_error("No shell scripts could be copied")
 
+    copy_files(copy_jobs)
+
     # Create initial constitution
     constitution_path = researchkit_dir / "memory" / "constitution.md"
-    if not constitution_path.exists():
-        constitution_path.write_text("""# Research Constitution
-
-## Research Methodology Principles
-
-### Citation Standards
-- All claims must be properly cited with sources
-- Prefer peer-reviewed sources when available
-- Cross-reference important claims with multiple sources
-- Maintain clear bibliography in sources.md
-
-### Source Quality Standards
-- Evaluate source credibility and bias
-- Note publication date and relevance
-- Distinguish between primary and secondary sources
-- Document limitations of sources
-
-### Research Process
-1. **Planning Phase**: Define clear research questions and scope
-2. **Execution Phase**: Systematic information gathering with proper documentation
-3. **Synthesis Phase**: Analysis and conclusion drawing with evidence
-
-### Verification Requirements
-- Cross-check facts across multiple sources
-- Question assumptions and biases
-- Document conflicting information
-- Mark uncertain claims clearly
-
----
-*This constitution guides all research activities in this project.*
-""")
+    try:
+        # "x" mode fails if the file exists, replacing a separate exists() check
+        with open(constitution_path, "xb") as constitution_file:
+            constitution_file.write(DEFAULT_CONSTITUTION)
+    except FileExistsError:
+        pass
+    else:
         tracker.add_step("Created research constitution")
 
 
-def create_agent_commands(project_dir: Path, ai_agent: str, tracker: StepTracker):
-    """Create AI agent-specific command files and directories"""
-    if ai_agent not in AGENT_CONFIG:
-        return
-
-    agent_config = AGENT_CONFIG[ai_agent]
-    commands_dir = project_dir / agent_config["commands_dir"]
-    commands_dir.mkdir(parents=True, exist_ok=True)
-
-    # For Claude, copy command files from templates
-    if ai_agent == "claude":
-        template_dir = get_template_dir()
-        commands_template_dir = template_dir.parent / "claude_commands"
-
-        if commands_template_dir.exists():
-            for command_file in commands_template_dir.glob("*.md"):
-                dst = commands_dir / command_file.name
-                shutil.copy2(command_file, dst)
-            tracker.add_step("Created Claude Code slash commands")
-        else:
-            tracker.add_error("Claude command templates not found")
-
-    # For GitHub Copilot, create custom prompt files
-    elif ai_agent == "copilot":
-        # Copy command files as .prompt.md files from templates
-        template_dir = get_template_dir()
-        commands_template_dir = template_dir.parent / "claude_commands"
-
-        if commands_template_dir.exists():
-            for command_file in commands_template_dir.glob("*.md"):
-                # Convert researchkit_constitution.md to constitution.prompt.md
-                prompt_name = command_file.stem.replace("researchkit_", "")
-                dst = commands_dir / f"{prompt_name}.prompt.md"
-
-                # Copy the file content (already has frontmatter)
-                shutil.copy2(command_file, dst)
-            tracker.add_step("Created GitHub Copilot custom prompts")
-        else:
-            tracker.add_error("Command templates not found")
+def create_claude_commands(commands_dir: Path, commands_template_dir: Path, agent_config: AgentSpec, tracker: StepTracker):
+    """Copy Claude Code slash commands from templates"""
+    if commands_template_dir.exists():
+        copy_files([
+            (command_file.path, commands_dir / command_file.name, False)
+            for command_file in iter_files(commands_template_dir, ".md")
+        ])
+        tracker.add_step("Created Claude Code slash commands")
+    else:
+        tracker.add_error("Claude command templates not found")
+
+
+def create_copilot_commands(commands_dir: Path, commands_template_dir: Path, agent_config: AgentSpec, tracker: StepTracker):
+    """Create GitHub Copilot custom prompt files"""
+    # Copy command files as .prompt.md files from templates
+    if commands_template_dir.exists():
+        prompt_jobs = []
+        for command_file in iter_files(commands_template_dir, ".md"):
+            # Convert researchkit_constitution.md to constitution.prompt.md
+            prompt_name = command_file.name.removesuffix(".md").replace("researchkit_", "")
+            dst = commands_dir / f"{prompt_name}.prompt.md"
+
+            # Copy the file content (already has frontmatter)
+            prompt_jobs.append((command_file.path, dst, False))
+        copy_files(prompt_jobs)
+        tracker.add_step("Created GitHub Copilot custom prompts")
+    else:
+        tracker.add_error("Command templates not found")
 
-        # Create README
-        readme_path = commands_dir / "README.md"
-        readme_content = f"""# ResearchKit with GitHub Copilot
+    # Create README
+    readme_path = commands_dir / "README.md"
+    readme_content = f"""# ResearchKit with GitHub Copilot
 
 This directory contains ResearchKit custom prompts for GitHub Copilot.
 
@@ -431,7 +571,7 @@ To use a custom prompt in Copilot Chat:
 2. Select the desired prompt from the list
 3. Or click the ➕ icon to add it as context
 
-{get_common_researchkit_sections()}
+{COMMON_SECTIONS}
 
 ## Copilot Tips for Research
 
@@ -441,36 +581,34 @@ To use a custom prompt in Copilot Chat:
 - Have Copilot help structure your findings
 - Let Copilot assist with summarizing sources
 """
-        readme_path.write_text(readme_content)
-        tracker.add_step(f"Created {agent_config['name']} configuration")
-
-    # For Gemini CLI, convert markdown templates to TOML format
-    elif ai_agent == "gemini":
-        # Convert slash command files from markdown to TOML
-        template_dir = get_template_dir()
-        commands_template_dir = template_dir.parent / "claude_commands"
-
-        if commands_template_dir.exists():
-            converted_count = 0
-            for command_file in commands_template_dir.glob("*.md"):
-                # Convert to TOML format
-                toml_content, command_name = convert_md_to_toml(command_file)
-
-                # Write TOML file
-                dst = commands_dir / f"{command_name}.toml"
-                dst.write_text(toml_content)
-                converted_count += 1
-
-            if converted_count > 0:
-                tracker.add_step(f"Created {converted_count} Gemini CLI slash commands (TOML format)")
-            else:
-                tracker.add_error("No command templates could be converted")
+    readme_path.write_text(readme_content, encoding="utf-8")
+    tracker.add_step(f"Created {agent_config.name} configuration")
+
+
+def create_gemini_commands(commands_dir: Path, commands_template_dir: Path, agent_config: AgentSpec, tracker: StepTracker):
+    """Convert slash commands to TOML format for Gemini CLI"""
+    # Convert slash command files from markdown to TOML
+    if commands_template_dir.exists():
+        converted_count = 0
+        for command_file in iter_files(commands_template_dir, ".md"):
+            # Convert to TOML format
+            toml_content, command_name = convert_md_to_toml(Path(command_file.path))
+
+            # Write TOML file
+            dst = commands_dir / f"{command_name}.toml"
+            dst.write_text(toml_content, encoding="utf-8")
+            converted_count += 1
+
+        if converted_count > 0:
+            tracker.add_step(f"Created {converted_count} Gemini CLI slash commands (TOML format)")
         else:
-            tracker.add_error("Command templates not found")
+            tracker.add_error("No command templates could be converted")
+    else:
+        tracker.add_error("Command templates not found")
 
-        # Create README
-        readme_path = commands_dir / "README.md"
-        readme_content = f"""# ResearchKit with Gemini CLI
+    # Create README
+    readme_path = commands_dir / "README.md"
+    readme_content = f"""# ResearchKit with Gemini CLI
 
 This directory contains ResearchKit slash commands for Gemini CLI in TOML format.
 
@@ -490,7 +628,7 @@ The following slash commands are available (stored as `.toml` files):
 
 **Note**: These commands are project-scoped and available when you run `gemini chat` from this directory.
 
-{get_common_researchkit_sections()}
+{COMMON_SECTIONS}
 
 ## Using Gemini CLI for Research
 
@@ -535,26 +673,25 @@ Gemini CLI can help with:
 - Get help with citation formatting
 - Request summaries of complex sources
 """
-        readme_path.write_text(readme_content)
-        tracker.add_step(f"Created {agent_config['name']} configuration")
-
-    # For Cursor, copy command files and create configuration with AI rules
-    elif ai_agent == "cursor":
-        # Copy slash command files from templates
-        template_dir = get_template_dir()
-        commands_template_dir = template_dir.parent / "claude_commands"
-
-        if commands_template_dir.exists():
-            for command_file in commands_template_dir.glob("*.md"):
-                dst = commands_dir / command_file.name
-                shutil.copy2(command_file, dst)
-            tracker.add_step("Created Cursor slash commands")
-        else:
-            tracker.add_error("Command templates not found")
+    readme_path.write_text(readme_content, encoding="utf-8")
+    tracker.add_step(f"Created {agent_config.name} configuration")
+
+
+def create_cursor_commands(commands_dir: Path, commands_template_dir: Path, agent_config: AgentSpec, tracker: StepTracker):
+    """Copy Cursor slash commands and create configuration with AI rules"""
+    # Copy slash command files from templates
+    if commands_template_dir.exists():
+        copy_files([
+            (command_file.path, commands_dir / command_file.name, False)
+            for command_file in iter_files(commands_template_dir, ".md")
+        ])
+        tracker.add_step("Created Cursor slash commands")
+    else:
+        tracker.add_error("Command templates not found")
 
-        # Create README
-        readme_path = commands_dir / "README.md"
-        readme_content = f"""# ResearchKit with Cursor
+    # Create README
+    readme_path = commands_dir / "README.md"
+    readme_content = f"""# ResearchKit with Cursor
 
 This directory contains ResearchKit slash commands for Cursor AI editor.
 
@@ -572,7 +709,7 @@ Use these commands in Cursor's AI chat:
 - `/researchkit.synthesize` - Generate comprehensive research report
 - `/researchkit.sources` - Manage bibliography and citations
 
-{get_common_researchkit_sections()}
+{COMMON_SECTIONS}
 
 ## Using Cursor for Research
 
@@ -591,11 +728,11 @@ Cursor's AI can help with:
 - Use Cursor to help maintain consistent document structure
 - Ask Cursor to help verify citation completeness
 """
-        readme_path.write_text(readme_content)
+    readme_path.write_text(readme_content, encoding="utf-8")
 
-        # Create .cursorrules file for AI context in parent directory
-        cursorrules_path = commands_dir.parent / ".cursorrules"
-        cursorrules_path.write_text("""# ResearchKit Cursor AI Rules
+    # Create .cursorrules file for AI context in parent directory
+    cursorrules_path = commands_dir.parent / ".cursorrules"
+    cursorrules_path.write_text("""# ResearchKit Cursor AI Rules
 
 ## Project Context
 This is a ResearchKit research project following structured research workflows.
@@ -629,26 +766,25 @@ This is a ResearchKit research project following structured research workflows.
 - Maintain chronological order in findings
 - Keep source quality ratings consistent
 - Follow the established document structure
-""")
-        tracker.add_step(f"Created {agent_config['name']} configuration with .cursorrules")
-
-    # For OpenCode, copy command files and create configuration and prompts
-    elif ai_agent == "opencode":
-        # Copy slash command files from templates
-        template_dir = get_template_dir()
-        commands_template_dir = template_dir.parent / "claude_commands"
-
-        if commands_template_dir.exists():
-            for command_file in commands_template_dir.glob("*.md"):
-                dst = commands_dir / command_file.name
-                shutil.copy2(command_file, dst)
-            tracker.add_step("Created OpenCode slash commands")
-        else:
-            tracker.add_error("Command templates not found")
+""", encoding="utf-8")
+    tracker.add_step(f"Created {agent_config.name} configuration with .cursorrules")
+
+
+def create_opencode_commands(commands_dir: Path, commands_template_dir: Path, agent_config: AgentSpec, tracker: StepTracker):
+    """Copy OpenCode slash commands and create configuration and prompts"""
+    # Copy slash command files from templates
+    if commands_template_dir.exists():
+        copy_files([
+            (command_file.path, commands_dir / command_file.name, False)
+            for command_file in iter_files(commands_template_dir, ".md")
+        ])
+        tracker.add_step("Created OpenCode slash commands")
+    else:
+        tracker.add_error("Command templates not found")
 
-        # Create README
-        readme_path = commands_dir / "README.md"
-        readme_content = f"""# ResearchKit with OpenCode
+    # Create README
+    readme_path = commands_dir / "README.md"
+    readme_content = f"""# ResearchKit with OpenCode
 
 This directory contains ResearchKit slash commands for OpenCode AI.
 
@@ -666,7 +802,7 @@ Use these commands in OpenCode's chat interface:
 - `/researchkit.synthesize` - Generate comprehensive research report
 - `/researchkit.sources` - Manage bibliography and citations
 
-{get_common_researchkit_sections()}
+{COMMON_SECTIONS}
 
 ## Using OpenCode for Research
 
@@ -703,14 +839,14 @@ opencode "Summarize these research findings into key themes: [findings]"
 - Get assistance with research methodology
 - Use OpenCode to identify gaps in your research
 """
-        readme_path.write_text(readme_content)
+    readme_path.write_text(readme_content, encoding="utf-8")
 
-        # Create prompts directory with research-specific prompts in parent directory
-        prompts_dir = commands_dir.parent / "prompts"
-        prompts_dir.mkdir(exist_ok=True)
+    # Create prompts directory with research-specific prompts in parent directory
+    prompts_dir = commands_dir.parent / "prompts"
+    prompts_dir.mkdir(exist_ok=True)
 
-        research_prompt = prompts_dir / "research_assistant.txt"
-        research_prompt.write_text("""You are a research assistant helping with structured research using ResearchKit.
+    research_prompt = prompts_dir / "research_assistant.txt"
+    research_prompt.write_text("""You are a research assistant helping with structured research using ResearchKit.
 
 Your role is to help maintain research quality by:
 1. Ensuring all claims are properly cited
@@ -733,14 +869,15 @@ When helping with research:
 - Maintain chronological organization
 - Cross-reference important findings
 - Follow established citation format
-""")
-        tracker.add_step(f"Created {agent_config['name']} configuration with prompts")
+""", encoding="utf-8")
+    tracker.add_step(f"Created {agent_config.name} configuration with prompts")
+
 
-    # For Codex CLI, create configuration with environment setup
-    elif ai_agent == "codex":
-        readme_path = commands_dir / "README.md"
-        codex_home_path = (project_dir / agent_config["commands_dir"]).as_posix()
-        readme_content = f"""# ResearchKit with Codex CLI
+def create_codex_commands(commands_dir: Path, commands_template_dir: Path, agent_config: AgentSpec, tracker: StepTracker):
+    """Create Codex CLI configuration with environment setup"""
+    readme_path = commands_dir / "README.md"
+    codex_home_path = commands_dir.as_posix()
+    readme_content = f"""# ResearchKit with Codex CLI
 
 This directory contains ResearchKit configuration for OpenAI Codex CLI.
 
@@ -772,7 +909,7 @@ $env:CODEX_HOME = "{codex_home_path}"
 
 Then restart your shell or run `source ~/.bashrc` (or equivalent).
 
-{get_common_researchkit_sections()}
+{COMMON_SECTIONS}
 
 ## Using Codex CLI for Research
 
@@ -808,10 +945,10 @@ codex "Generate matplotlib code to visualize [data description]"
 - Create data pipeline scripts
 - Build research tools and utilities
 """
-        readme_path.write_text(readme_content)
-        # Create config file
-        config_path = commands_dir / "config.json"
-        config_path.write_text("""{
+    readme_path.write_text(readme_content, encoding="utf-8")
+    # Create config file
+    config_path = commands_dir / "config.json"
+    config_path.write_text("""{
   "research_mode": true,
   "context": "ResearchKit structured research project",
   "files": {
@@ -827,22 +964,74 @@ codex "Generate matplotlib code to visualize [data description]"
     "Generate reproducible analysis"
   ]
 }
-""")
-        tracker.add_step(f"Created {agent_config['name']} configuration")
+""", encoding="utf-8")
+    tracker.add_step(f"Created {agent_config.name} configuration")
+
+    # Display environment setup message
+    get_console().print(f"\n[yellow]⚠  Important:[/yellow] Set CODEX_HOME environment variable:")
+    get_console().print(f"[cyan]   export CODEX_HOME=\"{codex_home_path}\"[/cyan]\n")
+
+
+# Per-agent command builders used by create_agent_commands
+AGENT_COMMAND_BUILDERS = {
+    "claude": create_claude_commands,
+    "copilot": create_copilot_commands,
+    "gemini": create_gemini_commands,
+    "cursor": create_cursor_commands,
+    "opencode": create_opencode_commands,
+    "codex": create_codex_commands,
+}
+
+
+def create_agent_commands(project_dir: Path, ai_agent: str, tracker: StepTracker):
+    """Create AI agent-specific command files and directories"""
+    if ai_agent not in AGENT_CONFIG:
+        return
+
+    agent_config = AGENT_CONFIG[ai_agent]
+    commands_dir = project_dir / agent_config.commands_dir
+    commands_dir.mkdir(parents=True, exist_ok=True)
 
-        # Display environment setup message
-        console.print(f"\n[yellow]⚠  Important:[/yellow] Set CODEX_HOME environment variable:")
-        console.print(f"[cyan]   export CODEX_HOME=\"{codex_home_path}\"[/cyan]\n")
+    # Slash command sources shared by the agent builders
+    commands_template_dir = get_template_dir().parent / "claude_commands"
 
+    builder = AGENT_COMMAND_BUILDERS.get(ai_agent)
+    if builder is not None:
+        builder(commands_dir, commands_template_dir, agent_config, tracker)
     # For other agents, create basic directory structure
     else:
-        tracker.add_step(f"Created {agent_config['name']} directory structure")
+        tracker.add_step(f"Created {agent_config.name} directory structure")
+
+
+def resolve_project_dir(project_name: Optional[Path]) -> Path:
+    """Resolve the init target while arguments are parsed
+
+    No name or '.' means the current directory, anything else is taken
+    relative to it.
+    """
+    if project_name is None or project_name == Path("."):
+        return Path.cwd()
+    return Path.cwd() / project_name
+
+
+# Parameter declarations are built once at import and shared by the commands
+PROJECT_DIR_ARGUMENT = typer.Argument(
+    None,
+    help="Project name or '.' for current directory",
+    metavar="project_name",
+    callback=resolve_project_dir,
+)
+AI_OPTION = typer.Option(
+    AIAgent.claude,
+    help="AI agent to use (supports: claude, copilot, gemini, cursor, opencode, codex)",
+)
+VERSION_OPTION = typer.Option(False, "--version", "-v", help="Show version")
 
 
 @app.command()
 def init(
-    project_name: Optional[str] = typer.Argument(None, help="Project name or '.' for current directory"),
-    ai: str = typer.Option("claude", help="AI agent to use (supports: claude, copilot, gemini, cursor, opencode, codex)"),
+    project_dir: Path = PROJECT_DIR_ARGUMENT,
+    ai: AIAgent = AI_OPTION,
 ):
     """
     Initialize a new ResearchKit project with structured research workflow support.
@@ -854,33 +1043,27 @@ def init(
     show_banner()
     tracker = StepTracker()
 
-    # Determine project directory
-    if project_name is None or project_name == ".":
-        project_dir = Path.cwd()
+    # project_dir was already resolved against the cwd by resolve_project_dir
+    in_current_dir = project_dir == Path.cwd()
+    if in_current_dir:
         tracker.add_step(f"Using current directory: {project_dir}")
     else:
-        project_dir = Path.cwd() / project_name
         project_dir.mkdir(parents=True, exist_ok=True)
         tracker.add_step(f"Created project directory: {project_dir}")
 
-    # Validate AI agent
-    if ai not in AGENT_CONFIG:
-        console.print(f"[red]Error:[/red] Unsupported AI agent: {ai}")
-        console.print(f"Supported agents: {', '.join(AGENT_CONFIG.keys())}")
-        raise typer.Exit(1)
-
+    # The AI agent is validated by typer against AIAgent before we get here
     agent_config = AGENT_CONFIG[ai]
-    tracker.add_step(f"Selected AI agent: {agent_config['name']}")
+    tracker.add_step(f"Selected AI agent: {agent_config.name}")
 
     # Check if CLI tool is required and available
-    if agent_config.get("requires_cli") and agent_config.get("cli_check"):
-        cli_tool = agent_config["cli_check"]
+    if agent_config.requires_cli and agent_config.cli_check:
+        cli_tool = agent_config.cli_check
         if not check_cli_tool(cli_tool):
-            console.print(f"\n[yellow]⚠[/yellow]  {agent_config['name']} CLI tool not found")
-            console.print(f"[yellow]   The '{cli_tool}' command is not available[/yellow]")
-            if agent_config.get("install_url"):
-                console.print(f"[yellow]   Install from: {agent_config['install_url']}[/yellow]")
-            console.print(f"\n[red]✗ {agent_config['name']} requires the CLI tool to be installed[/red]\n")
+            get_console().print(f"\n[yellow]⚠[/yellow]  {agent_config.name} CLI tool not found")
+            get_console().print(f"[yellow]   The '{cli_tool}' command is not available[/yellow]")
+            if agent_config.install_url:
+                get_console().print(f"[yellow]   Install from: {agent_config.install_url}[/yellow]")
+            get_console().print(f"\n[red]✗ {agent_config.name} requires the CLI tool to be installed[/red]\n")
             raise typer.Exit(1)
         tracker.add_step(f"Verified {cli_tool} CLI tool is installed")
 
@@ -896,39 +1079,39 @@ def init(
     # Display results
     tracker.display()
 
-    console.print("\n✨ [bold green]ResearchKit project initialized successfully![/bold green]\n")
-    console.print("Next steps:")
-    console.print("  1. [cyan]cd {}[/cyan]".format(project_dir if project_name and project_name != "." else "."))
+    get_console().print("\n✨ [bold green]ResearchKit project initialized successfully![/bold green]\n")
+    get_console().print("Next steps:")
+    get_console().print("  1. [cyan]cd {}[/cyan]".format("." if in_current_dir else project_dir))
 
     # Dynamic step 2 based on AI agent
     if ai == "claude":
-        console.print("  2. [cyan]claude[/cyan]  # Start Claude Code")
-        console.print("  3. Use [cyan]/researchkit.constitution[/cyan] to define research principles")
-        console.print("  4. Use [cyan]/researchkit.plan[/cyan] to start a research project\n")
+        get_console().print("  2. [cyan]claude[/cyan]  # Start Claude Code")
+        get_console().print("  3. Use [cyan]/researchkit.constitution[/cyan] to define research principles")
+        get_console().print("  4. Use [cyan]/researchkit.plan[/cyan] to start a research project\n")
     elif ai == "opencode":
-        console.print("  2. [cyan]opencode[/cyan]  # Start OpenCode")
-        console.print("  3. Review [cyan].researchkit/memory/constitution.md[/cyan] to define research principles")
-        console.print("  4. Run [cyan]bash .researchkit/scripts/bash/plan.sh \"Your Topic\"[/cyan] to start a research project\n")
+        get_console().print("  2. [cyan]opencode[/cyan]  # Start OpenCode")
+        get_console().print("  3. Review [cyan].researchkit/memory/constitution.md[/cyan] to define research principles")
+        get_console().print("  4. Run [cyan]bash .researchkit/scripts/bash/plan.sh \"Your Topic\"[/cyan] to start a research project\n")
     elif ai == "gemini":
-        console.print("  2. [cyan]gemini chat[/cyan]  # Start Gemini CLI")
-        console.print("  3. Review [cyan].researchkit/memory/constitution.md[/cyan] to define research principles")
-        console.print("  4. Run [cyan]bash .researchkit/scripts/bash/plan.sh \"Your Topic\"[/cyan] to start a research project\n")
+        get_console().print("  2. [cyan]gemini chat[/cyan]  # Start Gemini CLI")
+        get_console().print("  3. Review [cyan].researchkit/memory/constitution.md[/cyan] to define research principles")
+        get_console().print("  4. Run [cyan]bash .researchkit/scripts/bash/plan.sh \"Your Topic\"[/cyan] to start a research project\n")
     elif ai == "codex":
-        console.print("  2. Set CODEX_HOME environment variable (see [cyan]{}/README.md[/cyan])".format(agent_config["commands_dir"]))
-        console.print("  3. [cyan]codex[/cyan]  # Start Codex CLI")
-        console.print("  4. Review [cyan].researchkit/memory/constitution.md[/cyan] to define research principles")
-        console.print("  5. Run [cyan]bash .researchkit/scripts/bash/plan.sh \"Your Topic\"[/cyan] to start a research project\n")
+        get_console().print("  2. Set CODEX_HOME environment variable (see [cyan]{}/README.md[/cyan])".format(agent_config.commands_dir))
+        get_console().print("  3. [cyan]codex[/cyan]  # Start Codex CLI")
+        get_console().print("  4. Review [cyan].researchkit/memory/constitution.md[/cyan] to define research principles")
+        get_console().print("  5. Run [cyan]bash .researchkit/scripts/bash/plan.sh \"Your Topic\"[/cyan] to start a research project\n")
     elif ai == "copilot":
-        console.print("  2. Open this project in your IDE (VS Code, JetBrains, etc.)")
-        console.print("  3. Review [cyan].researchkit/memory/constitution.md[/cyan] to define research principles")
-        console.print("  4. Run [cyan]bash .researchkit/scripts/bash/plan.sh \"Your Topic\"[/cyan] to start a research project\n")
+        get_console().print("  2. Open this project in your IDE (VS Code, JetBrains, etc.)")
+        get_console().print("  3. Review [cyan].researchkit/memory/constitution.md[/cyan] to define research principles")
+        get_console().print("  4. Run [cyan]bash .researchkit/scripts/bash/plan.sh \"Your Topic\"[/cyan] to start a research project\n")
     elif ai == "cursor":
-        console.print("  2. [cyan]cursor .[/cyan]  # Open project in Cursor")
-        console.print("  3. Review [cyan].researchkit/memory/constitution.md[/cyan] to define research principles")
-        console.print("  4. Run [cyan]bash .researchkit/scripts/bash/plan.sh \"Your Topic\"[/cyan] to start a research project\n")
+        get_console().print("  2. [cyan]cursor .[/cyan]  # Open project in Cursor")
+        get_console().print("  3. Review [cyan].researchkit/memory/constitution.md[/cyan] to define research principles")
+        get_console().print("  4. Run [cyan]bash .researchkit/scripts/bash/plan.sh \"Your Topic\"[/cyan] to start a research project\n")
     else:
-        console.print("  2. Review [cyan].researchkit/memory/constitution.md[/cyan] to define research principles")
-        console.print("  3. Run [cyan]bash .researchkit/scripts/bash/plan.sh \"Your Topic\"[/cyan] to start a research project\n")
+        get_console().print("  2. Review [cyan].researchkit/memory/constitution.md[/cyan] to define research principles")
+        get_console().print("  3. Run [cyan]bash .researchkit/scripts/bash/plan.sh \"Your Topic\"[/cyan] to start a research project\n")
 
 
 @app.command()
@@ -936,59 +1119,67 @@ def check():
     """
     Check if required tools are installed (git, AI CLI tools).
     """
+    from rich.tree import Tree
+
     show_banner()
 
     checks = Tree("🔍 Checking Requirements")
 
+    # The probes are independent subprocesses, so run them concurrently and
+    # render the results afterwards in AGENT_CONFIG order
+    cli_agents = [
+        agent_config for agent_config in AGENT_CONFIG.values()
+        if agent_config.cli_check
+    ]
+    with ThreadPoolExecutor(max_workers=len(cli_agents) + 1) as executor:
+        git_future = executor.submit(get_git_version)
+        tool_futures = [
+            executor.submit(check_cli_tool, agent_config.cli_check)
+            for agent_config in cli_agents
+        ]
+
     # Check git
-    try:
-        result = subprocess.run(
-            ["git", "--version"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        version = result.stdout.strip()
+    version = git_future.result()
+    if version:
         checks.add(f"[green]✓[/green] Git: {version}")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    else:
         checks.add("[red]✗[/red] Git: Not found")
 
     # Check all AI agent CLI tools
-    for agent_name, agent_config in AGENT_CONFIG.items():
-        cli_tool = agent_config.get("cli_check")
-        if cli_tool:
-            is_required = agent_config.get("requires_cli", False)
-            if check_cli_tool(cli_tool):
-                checks.add(f"[green]✓[/green] {agent_config['name']}: Installed")
-            else:
-                status = "required" if is_required else "optional"
-                color = "red" if is_required else "yellow"
-                symbol = "✗" if is_required else "○"
-                checks.add(f"[{color}]{symbol}[/{color}] {agent_config['name']}: Not found ({status})")
+    for agent_config, tool_future in zip(cli_agents, tool_futures):
+        is_required = agent_config.requires_cli
+        if tool_future.result():
+            checks.add(f"[green]✓[/green] {agent_config.name}: Installed")
+        else:
+            status = "required" if is_required else "optional"
+            color = "red" if is_required else "yellow"
+            symbol = "✗" if is_required else "○"
+            checks.add(f"[{color}]{symbol}[/{color}] {agent_config.name}: Not found ({status})")
 
-    console.print(checks)
+    get_console().print(checks)
 
 
 @app.callback(invoke_without_command=True)
 def callback(
     ctx: typer.Context,
-    version: bool = typer.Option(False, "--version", "-v", help="Show version"),
+    version: bool = VERSION_OPTION,
 ):
     """
     ResearchKit CLI - Structured research workflows with AI integration
     """
     if version:
-        console.print(f"ResearchKit CLI v{__version__}")
+        # Plain echo keeps the version check free of Rich imports
+        typer.echo(f"ResearchKit CLI v{__version__}")
         raise typer.Exit(0)
 
     # If no subcommand was specified, show help
     if ctx.invoked_subcommand is None:
         show_banner()
-        console.print("\n[bold]Usage:[/bold] research [COMMAND]\n")
-        console.print("[bold]Commands:[/bold]")
-        console.print("  init   - Initialize a new ResearchKit project")
-        console.print("  check  - Verify required tools are installed\n")
-        console.print("[dim]Run 'research --help' for more information[/dim]\n")
+        get_console().print("\n[bold]Usage:[/bold] research [COMMAND]\n")
+        get_console().print("[bold]Commands:[/bold]")
+        get_console().print("  init   - Initialize a new ResearchKit project")
+        get_console().print("  check  - Verify required tools are installed\n")
+        get_console().print("[dim]Run 'research --help' for more information[/dim]\n")
 
 
 def main():